@@ -10,15 +10,32 @@ FEATURES = [
     ("Reusable layout", "Keep your HTML organized with sections for header, content, and footer."),
 ]
 
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Placeholder rendered in place of the timestamp, then split out of the page.
+TIME_MARKER = "\x00current_time\x00"
+
+_page_parts: tuple[str, str] | None = None
+
+
+def _render_page(current_time: str) -> str:
+    return render_template("index.html", features=FEATURES, current_time=current_time)
+
 
 @app.route("/")
 def homepage():
     """Render a simple HTML page that uses dynamic data."""
-    return render_template(
-        "index.html",
-        features=FEATURES,
-        current_time=datetime.utcnow(),
-    )
+    global _page_parts
+    current_time = datetime.utcnow().strftime(TIME_FORMAT)
+    if app.debug:
+        # Re-render every time so template edits show up on refresh.
+        return _render_page(current_time)
+    # Everything except the timestamp is static, so render the template once
+    # and reuse the text around the timestamp for every later request.
+    if _page_parts is None:
+        prefix, suffix = _render_page(TIME_MARKER).split(TIME_MARKER)
+        _page_parts = prefix, suffix
+    prefix, suffix = _page_parts
+    return prefix + current_time + suffix
 
 
 if __name__ == "__main__":
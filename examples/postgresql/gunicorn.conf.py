@@ -0,0 +1,36 @@
+"""
+Production server settings for the PostgreSQL example.
+
+gunicorn picks this file up automatically when started from this folder:
+
+    gunicorn app:app
+
+Each worker is a gthread worker, so one process serves several requests at
+once while sharing its connection pool. Keep PG_POOL_MAX >= threads, otherwise
+busy threads queue for a connection (and give up with 503 after PG_POOL_TIMEOUT).
+"""
+
+import multiprocessing
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+bind = f"127.0.0.1:{os.getenv('PORT', '5000')}"
+worker_class = "gthread"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+keepalive = 5
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Give every worker its own pool instead of sockets inherited from the master."""
+    from app import init_cache, reset_pool
+
+    # The pool connects lazily on the first request, so a database outage
+    # never stops a worker from booting.
+    reset_pool()
+    # Without REDIS_URL, separate worker caches cannot see each other's writes.
+    init_cache(processes=server.cfg.workers)